@@ -2,23 +2,20 @@
 # 기상청 단기예보 API를 활용한 MCP 서버
 import os
 import logging
-import requests
 from datetime import datetime, timedelta
 from fastmcp import FastMCP
 from dotenv import load_dotenv
+from mcp_runtime import run_server, create_http_app
+from log_config import setup_logging, sample_call, Payload
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    datefmt='%H:%M:%S'
-)
-logger = logging.getLogger(__name__)
-
-# 환경 설정
+# 환경 설정 (.env의 LOG_* 설정이 반영되도록 로깅 설정보다 먼저 로드)
 load_dotenv()
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")  # 공공데이터포털 API 키
 
+# 로깅 설정 (LOG_FORMAT, LOG_SAMPLE_RATE 등은 log_config.py 참고)
+setup_logging()
+logger = logging.getLogger(__name__)
+
 # 1. MCP 서버 생성
 mcp = FastMCP("Korea Weather Server")
 
@@ -92,13 +89,15 @@ def get_korea_weather(location: str) -> str:
     지원 도시: 서울, 부산, 대구, 인천, 광주, 대전, 울산, 제주
     영문 입력도 가능: Seoul, Busan, Daegu, Incheon, Gwangju, Daejeon, Ulsan, Jeju
     """
-    logger.info(f"SHKWON - 🔧 [get_korea_weather] 호출됨 | 입력: location='{location}'")
+    log_call = sample_call()
+    if log_call:
+        logger.info("SHKWON - 🔧 [get_korea_weather] 호출됨 | 입력: location='%s'", Payload(location))
     
     # 격자 좌표 확인
     grid = LOCATION_GRID.get(location)
     if not grid:
         result = f"지원하지 않는 지역입니다: {location}. 지원 도시: {list(LOCATION_GRID.keys())}"
-        logger.warning(f"   ⚠️ {result}")
+        logger.warning("   ⚠️ %s", Payload(result))
         return result
     
     # API 키 확인
@@ -124,9 +123,13 @@ def get_korea_weather(location: str) -> str:
             "Jeju": "기온: 12°C, 구름많음, 습도: 65%",
         }
         result = dummy_weather.get(location, "날씨 정보 없음")
-        logger.info(f"   ✅ 더미 결과: {result}")
+        if log_call:
+            logger.info("   ✅ 더미 결과: %s", Payload(result))
         return result
     
+    # requests는 실제 API를 호출할 때만 필요하므로 첫 호출 시 임포트 (더미 모드 기동 시간 단축)
+    import requests
+
     try:
         base_date, base_time = get_base_datetime()
         
@@ -143,7 +146,8 @@ def get_korea_weather(location: str) -> str:
             "ny": grid["ny"]
         }
         
-        logger.info(f"   📡 API 호출: {base_date} {base_time} ({location})")
+        if log_call:
+            logger.info("   📡 API 호출: %s %s (%s)", base_date, base_time, Payload(location))
         response = requests.get(url, params=params, timeout=10)
         response.raise_for_status()
         
@@ -154,7 +158,7 @@ def get_korea_weather(location: str) -> str:
         
         if not items:
             result = f"{location}의 날씨 정보를 가져올 수 없습니다."
-            logger.warning(f"   ⚠️ {result}")
+            logger.warning("   ⚠️ %s", Payload(result))
             return result
         
         # 날씨 정보 추출
@@ -175,16 +179,17 @@ def get_korea_weather(location: str) -> str:
                 weather_info["풍속"] = f"{fcst_value}m/s"
         
         result = f"{location} 날씨: " + ", ".join([f"{k}: {v}" for k, v in weather_info.items()])
-        logger.info(f"   ✅ 결과: {result}")
+        if log_call:
+            logger.info("   ✅ 결과: %s", Payload(result))
         return result
         
     except requests.RequestException as e:
         result = f"API 호출 오류: {str(e)}"
-        logger.error(f"   ❌ {result}")
+        logger.error("   ❌ %s", Payload(result))
         return result
     except Exception as e:
         result = f"오류 발생: {str(e)}"
-        logger.error(f"   ❌ {result}")
+        logger.error("   ❌ %s", Payload(result))
         return result
 
 
@@ -196,12 +201,14 @@ def get_weather_forecast(location: str, hours: int = 24) -> str:
     location: 도시명 (서울, 부산, 대구, 인천, 광주, 대전, 울산, 제주)
     hours: 예보 시간 (기본 24시간)
     """
-    logger.info(f"SHKWON - 🔧 [get_weather_forecast] 호출됨 | location='{location}', hours={hours}")
+    log_call = sample_call()
+    if log_call:
+        logger.info("SHKWON - 🔧 [get_weather_forecast] 호출됨 | location='%s', hours=%s", Payload(location), hours)
     
     grid = LOCATION_GRID.get(location)
     if not grid:
         result = f"지원하지 않는 지역입니다: {location}"
-        logger.warning(f"   ⚠️ {result}")
+        logger.warning("   ⚠️ %s", Payload(result))
         return result
     
     # 간단한 예보 정보 반환 (더미 데이터)
@@ -213,7 +220,8 @@ def get_weather_forecast(location: str, hours: int = 24) -> str:
 - 강수확률: 10%
 - 미세먼지: 보통
 """
-    logger.info(f"   ✅ 예보 생성 완료")
+    if log_call:
+        logger.info("   ✅ 예보 생성 완료")
     return forecast.strip()
 
 
@@ -223,18 +231,26 @@ def get_supported_cities() -> str:
     ========== SHKWON ==========
     지원하는 한국 도시 목록을 반환합니다.
     """
-    logger.info("SHKWON 🔧 [get_supported_cities] 호출됨")
+    log_call = sample_call()
+    if log_call:
+        logger.info("SHKWON 🔧 [get_supported_cities] 호출됨")
     cities = list(set([k for k in LOCATION_GRID.keys() if not k[0].isupper()]))  # 한글만
     result = f"지원 도시: {', '.join(cities)}"
-    logger.info(f"   ✅ {result}")
+    if log_call:
+        logger.info("   ✅ %s", Payload(result))
     return result
 
 
 # 5. 서버 실행
+def create_app():
+    """멀티 워커 실행용 ASGI 앱 팩토리 (uvicorn이 워커마다 호출)"""
+    return create_http_app(mcp)
+
+
 if __name__ == "__main__":
     logger.info("=" * 50)
     logger.info("🌤️ Korea Weather Server 시작 중...")
-    logger.info(f"📦 등록된 도구: get_korea_weather, get_weather_forecast, get_supported_cities")
-    logger.info(f"🏙️ 지원 도시: 서울, 부산, 대구, 인천, 광주, 대전, 울산, 제주")
+    logger.info("📦 등록된 도구: get_korea_weather, get_weather_forecast, get_supported_cities")
+    logger.info("🏙️ 지원 도시: 서울, 부산, 대구, 인천, 광주, 대전, 울산, 제주")
     logger.info("=" * 50)
-    mcp.run(transport="sse", port=8003)
+    run_server(mcp, "weather", "KoreaWeather:create_app")
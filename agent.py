@@ -5,23 +5,20 @@ import logging
 import json
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
-from fastmcp import Client
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    datefmt='%H:%M:%S'
-)
-logger = logging.getLogger(__name__)
+from mcp_runtime import server_target, create_client
+from log_config import setup_logging
 
-# 1. 환경 변수 로드
+# 1. 환경 변수 로드 (.env의 LOG_* 설정이 반영되도록 로깅 설정보다 먼저 로드)
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-# 2. 로컬에 떠 있는 MCP 서버(Fashion Server)에 연결
-MCP_SERVER_URL = "http://localhost:8002/sse"
-mcp_client = Client(MCP_SERVER_URL)
+# 로깅 설정 (LOG_FORMAT 등은 log_config.py 참고)
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# 2. 로컬에 떠 있는 MCP 서버(Fashion Server)에 연결 (전송 방식은 MCP_TRANSPORT 환경 변수로 선택)
+MCP_SERVER_URL = server_target("fashion")
+mcp_client = create_client(MCP_SERVER_URL)
 
 # 3. OpenAI 클라이언트 생성
 openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
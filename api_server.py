@@ -1,33 +1,43 @@
 # api_server.py
 import os
+import time
+import asyncio
 import logging
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
-from fastmcp import Client
-import uvicorn
+from mcp_runtime import server_target, create_client, get_transport
+from log_config import setup_logging, sample_call, Payload
 import json
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    datefmt='%H:%M:%S'
-)
-logger = logging.getLogger(__name__)
+# openai, fastmcp, uvicorn은 기동 시간 단축을 위해 첫 사용 시점에 임포트합니다.
 
-# 1. 환경 설정
+# 1. 환경 설정 (.env의 LOG_* 설정이 반영되도록 로깅 설정보다 먼저 로드)
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-# MCP 서버 목록 (여러 서버 지원)
+# 로깅 설정 (LOG_FORMAT, LOG_SAMPLE_RATE 등은 log_config.py 참고)
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# MCP 서버 목록 (여러 서버 지원, 전송 방식은 MCP_TRANSPORT 환경 변수로 선택)
 MCP_SERVERS = {
-    "fashion": "http://localhost:8002/sse",   # Fashion Server
-    "weather": "http://localhost:8003/sse",   # Korea Weather Server
+    "fashion": server_target("fashion"),   # Fashion Server
+    "weather": server_target("weather"),   # Korea Weather Server
 }
 
+# MCP 서버 연결 타임아웃 (서버별, 초)
+MCP_DISCOVERY_TIMEOUT = float(os.getenv("MCP_DISCOVERY_TIMEOUT", "5"))
+# 준비되지 않은 MCP 서버 재탐색 최소 간격 (초)
+MCP_DISCOVERY_RETRY_INTERVAL = float(os.getenv("MCP_DISCOVERY_RETRY_INTERVAL", "10"))
+
+# MCP 서버별 탐색 결과 (서버 이름 -> {"ready": bool, "tools" | "error": ...})
+mcp_status = {}
+discovery_task = None
+last_discovery_at = 0.0
+
 # 2. FastAPI 앱 생성
 app = FastAPI(title="AI Stylist API")
 
@@ -51,8 +61,16 @@ SYSTEM_INSTRUCTION = """
 class ChatRequest(BaseModel):
     query: str  # 예: "ideabong 오늘 뭐 입어?" 또는 "서울 날씨 알려줘"
 
-# 4. OpenAI 클라이언트 생성 (전역으로 한 번만)
-openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# 4. OpenAI 클라이언트 생성 (첫 요청 시 한 번만)
+_openai_client = None
+
+def get_openai_client():
+    """OpenAI 클라이언트를 첫 사용 시 생성하여 재사용"""
+    global _openai_client
+    if _openai_client is None:
+        from openai import AsyncOpenAI
+        _openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
 
 # MCP 도구를 OpenAI 함수 형식으로 변환
 def convert_mcp_tools_to_openai(mcp_tools):
@@ -75,26 +93,76 @@ def find_mcp_client_for_tool(tool_name: str, tool_to_client_map: dict):
     """도구 이름으로 해당 MCP 클라이언트 반환"""
     return tool_to_client_map.get(tool_name)
 
-# 5. 서버 시작 시 도구 목록 출력
+# 5. 서버 시작 시 도구 목록 확인 (백그라운드)
+async def discover_server(server_name: str, server_url: str):
+    """MCP 서버 하나에 연결하여 도구 목록을 출력하고 도구 이름 목록 반환"""
+    mcp_client = create_client(server_url)
+    async with mcp_client:
+        tools_list = await mcp_client.list_tools()
+    logger.info("📦 [%s] 사용 가능한 도구 (%d개):", server_name.upper(), len(tools_list))
+    for tool in tools_list:
+        logger.info("   📌 %s", tool.name)
+        logger.info("      설명: %s", tool.description)
+        if hasattr(tool, 'inputSchema') and tool.inputSchema:
+            params = tool.inputSchema.get('properties', {})
+            if params:
+                logger.info("      파라미터: %s", list(params.keys()))
+    return [tool.name for tool in tools_list]
+
+def mark_server_down(server_name: str, error: BaseException):
+    """MCP 서버 연결 실패를 mcp_status에 기록"""
+    message = "연결 시간 초과" if isinstance(error, asyncio.TimeoutError) else str(error)
+    mcp_status[server_name] = {"ready": False, "error": message}
+    logger.warning("⚠️ [%s] MCP 서버 연결 실패: %s", server_name.upper(), Payload(message))
+
+async def discover_servers(server_names: list):
+    """MCP 서버들을 동시에 탐색하여 mcp_status 갱신 (서버별 타임아웃 적용)"""
+    results = await asyncio.gather(
+        *(asyncio.wait_for(discover_server(name, MCP_SERVERS[name]), MCP_DISCOVERY_TIMEOUT) for name in server_names),
+        return_exceptions=True,
+    )
+    for server_name, result in zip(server_names, results):
+        if isinstance(result, BaseException):
+            mark_server_down(server_name, result)
+        else:
+            mcp_status[server_name] = {"ready": True, "tools": result}
+
+def schedule_discovery():
+    """
+    준비되지 않은 MCP 서버 탐색을 백그라운드로 시작
+    이미 탐색 중이거나 마지막 탐색 후 MCP_DISCOVERY_RETRY_INTERVAL이 지나지 않았으면 건너뜁니다.
+    """
+    global discovery_task, last_discovery_at
+    if discovery_task is not None and not discovery_task.done():
+        return
+    pending = [name for name in MCP_SERVERS if not mcp_status.get(name, {}).get("ready")]
+    now = time.monotonic()
+    if not pending or (discovery_task is not None and now - last_discovery_at < MCP_DISCOVERY_RETRY_INTERVAL):
+        return
+    last_discovery_at = now
+    discovery_task = asyncio.create_task(discover_servers(pending))
+
 @app.on_event("startup")
 async def startup_event():
-    logger.info("📡 MCP 서버들에 연결하여 도구 목록 확인 중...")
-    
-    for server_name, server_url in MCP_SERVERS.items():
-        try:
-            mcp_client = Client(server_url)
-            async with mcp_client:
-                tools_list = await mcp_client.list_tools()
-                logger.info(f"📦 [{server_name.upper()}] 사용 가능한 도구 ({len(tools_list)}개):")
-                for tool in tools_list:
-                    logger.info(f"   📌 {tool.name}")
-                    logger.info(f"      설명: {tool.description}")
-                    if hasattr(tool, 'inputSchema') and tool.inputSchema:
-                        params = tool.inputSchema.get('properties', {})
-                        if params:
-                            logger.info(f"      파라미터: {list(params.keys())}")
-        except Exception as e:
-            logger.warning(f"⚠️ [{server_name.upper()}] MCP 서버 연결 실패: {e}")
+    # 탐색을 기다리지 않고 바로 요청을 받기 시작 (준비 상태는 /ready로 확인)
+    logger.info("📡 MCP 서버들에 연결하여 도구 목록 확인 중... (백그라운드)")
+    schedule_discovery()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 진행 중인 탐색이 앱 종료 후까지 남지 않도록 취소
+    if discovery_task is not None and not discovery_task.done():
+        discovery_task.cancel()
+
+async def open_server(server_url: str):
+    """MCP 서버에 연결하여 (열린 Client, 도구 목록) 반환 (도구 조회 실패 시 연결 정리)"""
+    mcp_client = create_client(server_url)
+    await mcp_client.__aenter__()  # 연결 시작
+    try:
+        return mcp_client, await mcp_client.list_tools()
+    except BaseException:
+        await mcp_client.__aexit__(None, None, None)
+        raise
 
 # 6. API 엔드포인트 생성
 @app.post("/chat")
@@ -103,37 +171,50 @@ async def chat_endpoint(request: ChatRequest):
     React에서 질문을 받아 OpenAI Agent를 실행하고 결과를 반환합니다.
     여러 MCP 서버의 도구를 통합하여 사용합니다.
     """
-    logger.info(f"📨 요청 받음: {request.query}")
+    log_call = sample_call()
+    if log_call:
+        logger.info("📨 요청 받음: %s", Payload(request.query))
+
+    mcp_clients = {}  # 서버 URL -> Client 객체 (오류가 나도 finally에서 정리)
 
     try:
-        # (1) 모든 MCP 클라이언트 연결 및 도구 수집
+        openai_client = get_openai_client()
+
+        # (1) MCP 클라이언트 동시 연결 및 도구 수집
+        # 준비된 것으로 확인된 서버에만 연결하고, 아직 탐색 결과가 없으면 모든 서버에 시도
         all_openai_tools = []
         tool_to_server = {}  # 도구 이름 -> 서버 URL 매핑
-        mcp_clients = {}     # 서버 URL -> Client 객체
-        
-        for server_name, server_url in MCP_SERVERS.items():
-            try:
-                mcp_client = Client(server_url)
-                await mcp_client.__aenter__()  # 연결 시작
-                mcp_clients[server_url] = mcp_client
-                
-                tools_list = await mcp_client.list_tools()
-                openai_tools = convert_mcp_tools_to_openai(tools_list)
-                
-                for tool in openai_tools:
-                    tool_name = tool['function']['name']
-                    tool_to_server[tool_name] = server_url
-                    all_openai_tools.append(tool)
-                
-                logger.info(f"✅ [{server_name.upper()}] 연결 성공 - {len(tools_list)}개 도구 로드")
-                
-            except Exception as e:
-                logger.warning(f"⚠️ [{server_name.upper()}] 연결 실패: {e}")
-        
+
+        server_names = [name for name in MCP_SERVERS if mcp_status.get(name, {}).get("ready")] or list(MCP_SERVERS)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(open_server(MCP_SERVERS[name]), MCP_DISCOVERY_TIMEOUT) for name in server_names),
+            return_exceptions=True,
+        )
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                mark_server_down(server_name, result)
+                continue
+
+            server_url = MCP_SERVERS[server_name]
+            mcp_client, tools_list = result
+            mcp_clients[server_url] = mcp_client
+
+            for tool in convert_mcp_tools_to_openai(tools_list):
+                tool_name = tool['function']['name']
+                tool_to_server[tool_name] = server_url
+                all_openai_tools.append(tool)
+
+            if log_call:
+                logger.info("✅ [%s] 연결 성공 - %d개 도구 로드", server_name.upper(), len(tools_list))
+
+        # 빠진 서버는 백그라운드로 재탐색하여 다음 요청부터 사용
+        schedule_discovery()
+
         if not all_openai_tools:
             raise HTTPException(status_code=503, detail="MCP 서버에 연결할 수 없습니다.")
         
-        logger.info(f"🔧 총 {len(all_openai_tools)}개 도구 사용 가능: {[t['function']['name'] for t in all_openai_tools]}")
+        if log_call:
+            logger.info("🔧 총 %d개 도구 사용 가능: %s", len(all_openai_tools), Payload(list(tool_to_server)))
 
         # (2) 에이전트 실행 로직
         # 메시지 초기화
@@ -155,7 +236,8 @@ async def chat_endpoint(request: ChatRequest):
 
         # 도구 호출이 필요한 경우 처리
         while assistant_message.tool_calls:
-            logger.info(f"🔧 도구 호출 감지: {len(assistant_message.tool_calls)}개")
+            if log_call:
+                logger.info("🔧 도구 호출 감지: %d개", len(assistant_message.tool_calls))
             
             # 어시스턴트 메시지 추가
             messages.append(assistant_message)
@@ -165,19 +247,21 @@ async def chat_endpoint(request: ChatRequest):
                 function_name = tool_call.function.name
                 function_args = json.loads(tool_call.function.arguments)
                 
-                logger.info(f"   📌 도구 실행: {function_name}({function_args})")
+                if log_call:
+                    logger.info("   📌 도구 실행: %s(%s)", function_name, Payload(function_args))
                 
                 # 해당 도구가 속한 MCP 서버 찾기
                 server_url = tool_to_server.get(function_name)
                 if not server_url or server_url not in mcp_clients:
                     tool_result = f"도구를 찾을 수 없습니다: {function_name}"
-                    logger.error(f"   ❌ {tool_result}")
+                    logger.error("   ❌ %s", Payload(tool_result))
                 else:
                     # MCP를 통해 도구 실행
                     mcp_client = mcp_clients[server_url]
                     result = await mcp_client.call_tool(function_name, function_args)
                     tool_result = str(result.content[0].text) if result.content else "결과 없음"
-                    logger.info(f"   ✅ 도구 결과: {tool_result}")
+                    if log_call:
+                        logger.info("   ✅ 도구 결과: %s", Payload(tool_result))
                 
                 # 도구 결과를 메시지에 추가
                 messages.append({
@@ -197,33 +281,48 @@ async def chat_endpoint(request: ChatRequest):
             assistant_message = response.choices[0].message
 
         final_response = assistant_message.content
-        logger.info(f"✅ 응답 생성 완료")
-        logger.info(f"📊 응답 텍스트 길이: {len(final_response) if final_response else 0}")
-
-        # (3) MCP 클라이언트 정리
-        for mcp_client in mcp_clients.values():
-            try:
-                await mcp_client.__aexit__(None, None, None)
-            except:
-                pass
+        if log_call:
+            logger.info("✅ 응답 생성 완료 | 응답 텍스트 길이: %d", len(final_response) if final_response else 0)
 
-        # (4) 결과 반환
+        # (3) 결과 반환
         return {"response": final_response}
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 오류 발생: %s", Payload(e))
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # (4) MCP 클라이언트 정리 (stdio 전송에서는 서버 프로세스 종료)
+        for mcp_client in mcp_clients.values():
+            try:
+                await mcp_client.__aexit__(None, None, None)
+            except Exception:
+                pass
 
 @app.get("/health")
 async def health_check():
     """서버 상태 확인용"""
     return {"status": "ok", "mcp_servers": MCP_SERVERS}
 
+@app.get("/ready")
+async def ready_check():
+    """준비 상태 확인용 (MCP 서버가 하나 이상 연결되면 200, 아니면 503)"""
+    # 준비되지 않은 서버가 있으면 재탐색 (MCP 서버가 게이트웨이보다 늦게 뜬 경우, 간격 제한 있음)
+    schedule_discovery()
+    if any(status["ready"] for status in mcp_status.values()):
+        return {"status": "ready", "mcp_servers": mcp_status}
+
+    starting = not mcp_status or (discovery_task is not None and not discovery_task.done())
+    return JSONResponse(
+        status_code=503,
+        content={"status": "starting" if starting else "unavailable", "mcp_servers": mcp_status},
+    )
+
 if __name__ == "__main__":
-    logger.info("🚀 AI Stylist API 서버 시작 (포트: 8004)")
-    logger.info(f"📡 MCP 서버 목록: {list(MCP_SERVERS.keys())}")
-    uvicorn.run(app, host="0.0.0.0", port=8004)
\ No newline at end of file
+    import uvicorn
+
+    port = int(os.getenv("API_PORT", "8004"))
+    logger.info("🚀 AI Stylist API 서버 시작 (포트: %d)", port)
+    logger.info("📡 MCP 서버 목록: %s (전송: %s)", list(MCP_SERVERS.keys()), get_transport())
+    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
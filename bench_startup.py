@@ -0,0 +1,160 @@
+# bench_startup.py
+# 기동 시간 벤치마크: 모듈 임포트 시간과 API 서버의 time-to-ready 측정
+#
+# 사용법: python bench_startup.py [반복 횟수]
+# - 임포트 시간: 새 파이썬 프로세스에서 각 모듈을 임포트하는 데 걸린 시간 (중앙값)
+# - time-to-serve: api_server.py 실행 후 /health가 응답할 때까지 걸린 시간 (중앙값)
+# - time-to-ready: api_server.py 실행 후 /ready가 200을 반환할 때까지 걸린 시간 (중앙값)
+#   Fashion / Korea Weather 서버는 벤치마크용 포트로 먼저 띄워 두고 게이트웨이를 그쪽에 연결합니다.
+import os
+import sys
+import time
+import statistics
+import subprocess
+import urllib.error
+import urllib.request
+
+from mcp_runtime import BASE_DIR, get_transport
+from bench_transport import wait_for_port
+
+MODULES = ["api_server", "server", "KoreaWeather"]
+
+BENCH_PORT = "8104"
+# 벤치마크용 MCP 서버 (스크립트, 포트 환경 변수, 포트)
+MCP_BENCH_SERVERS = [
+    ("server.py", "FASHION_MCP_PORT", "8105"),
+    ("KoreaWeather.py", "WEATHER_MCP_PORT", "8106"),
+]
+READY_TIMEOUT = 30.0
+
+
+def measure_import(module: str, repeat: int) -> float:
+    """새 프로세스에서 모듈 임포트 시간(초)의 중앙값"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - t)"
+    )
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def http_status(url: str):
+    """GET 요청의 상태 코드 반환 (연결 실패 시 None)"""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return None
+
+
+def start_mcp_servers():
+    """벤치마크용 포트로 MCP 서버들을 띄우고 프로세스 목록 반환 (stdio는 게이트웨이가 직접 띄움)"""
+    for _, port_env, port in MCP_BENCH_SERVERS:
+        os.environ[port_env] = port
+    if get_transport() == "stdio":
+        return []
+
+    processes = []
+    for script, _, port in MCP_BENCH_SERVERS:
+        processes.append(subprocess.Popen(
+            [sys.executable, script],
+            cwd=BASE_DIR,
+            env=os.environ.copy(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ))
+    try:
+        for _, _, port in MCP_BENCH_SERVERS:
+            wait_for_port(int(port))
+    except TimeoutError:
+        stop_processes(processes)
+        raise
+    return processes
+
+
+def stop_processes(processes):
+    """서버 프로세스 종료 및 대기"""
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.wait()
+
+
+def measure_ready():
+    """api_server.py 실행 후 (time-to-serve, time-to-ready) 반환, 준비되지 않으면 ready는 None"""
+    env = dict(os.environ, API_PORT=BENCH_PORT)
+    base_url = f"http://127.0.0.1:{BENCH_PORT}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "api_server.py"],
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    serve_time = ready_time = None
+    try:
+        while time.perf_counter() - started < READY_TIMEOUT:
+            if serve_time is None:
+                if http_status(f"{base_url}/health") == 200:
+                    serve_time = time.perf_counter() - started
+            elif http_status(f"{base_url}/ready") == 200:
+                ready_time = time.perf_counter() - started
+                break
+            time.sleep(0.05)
+    finally:
+        process.terminate()
+        process.wait()
+    return serve_time, ready_time
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"임포트 시간 (중앙값, {repeat}회)")
+    print("-" * 50)
+    for module in MODULES:
+        try:
+            print(f"{module:<16} {measure_import(module, repeat) * 1000:>8.1f} ms")
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<16} 실패: {e.stderr.strip().splitlines()[-1]}")
+
+    print("-" * 50)
+    print(f"API 서버 기동 시간 (중앙값, {repeat}회, 전송: {get_transport()})")
+    print("-" * 50)
+    try:
+        mcp_servers = start_mcp_servers()
+    except TimeoutError as e:
+        print(f"MCP 서버 기동 실패: {e}")
+        return
+    try:
+        runs = [measure_ready() for _ in range(repeat)]
+    finally:
+        stop_processes(mcp_servers)
+
+    for label, samples in (
+        ("time-to-serve", [serve for serve, _ in runs]),
+        ("time-to-ready", [ready for _, ready in runs]),
+    ):
+        measured = [sample for sample in samples if sample is not None]
+        if not measured:
+            print(f"{label:<16} 실패 ({READY_TIMEOUT}초 안에 응답 없음)")
+            continue
+        failed = f"  (실패 {len(samples) - len(measured)}회)" if len(measured) < len(samples) else ""
+        print(f"{label:<16} {statistics.median(measured) * 1000:>8.1f} ms{failed}")
+
+
+if __name__ == "__main__":
+    main()
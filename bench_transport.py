@@ -0,0 +1,131 @@
+# bench_transport.py
+# 전송 방식별 MCP 도구 호출 처리량 비교 벤치마크
+#
+# 사용법: python bench_transport.py [동시 클라이언트 수] [측정 시간(초)]
+# 각 전송 방식으로 Fashion Server를 띄운 뒤 get_member_profile을 반복 호출하여 초당 호출 수를 측정합니다.
+# 모든 클라이언트의 연결이 끝난 뒤에 측정을 시작하므로 연결(및 stdio 서버 기동) 시간은 포함되지 않습니다.
+import os
+import sys
+import time
+import socket
+import asyncio
+import subprocess
+
+from mcp_runtime import BASE_DIR, server_target, create_client
+
+# (이름, 환경 변수) - stdio는 클라이언트가 서버 프로세스를 직접 띄우므로 동시 클라이언트 수만큼 프로세스가 생성됨
+CASES = [
+    ("sse", {"MCP_TRANSPORT": "sse"}),
+    ("http", {"MCP_TRANSPORT": "http"}),
+    ("http x4 workers", {"MCP_TRANSPORT": "http", "MCP_WORKERS": "4"}),
+    ("stdio", {"MCP_TRANSPORT": "stdio"}),
+]
+
+BENCH_PORT = "8102"
+CONNECT_TIMEOUT = 120.0
+
+
+def wait_for_port(port: int, timeout: float = 30.0):
+    """서버가 포트를 열 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"서버가 {timeout}초 안에 시작되지 않았습니다 (port {port})")
+
+
+async def client_loop(target: str, connected: asyncio.Queue, start: asyncio.Event, stop: asyncio.Event, log_file):
+    """
+    세션 하나를 연결한 뒤 시작 신호를 기다렸다가 종료 신호까지 도구를 반복 호출
+    (성공 횟수, 마지막 호출 완료 시각) 반환
+    """
+    calls = 0
+    finished_at = 0.0
+    async with create_client(target, log_file=log_file) as client:
+        await connected.put(None)
+        await start.wait()
+        while not stop.is_set():
+            await client.call_tool("get_member_profile", {"name": "ideabong"})
+            calls += 1
+            finished_at = time.perf_counter()
+    return calls, finished_at
+
+
+async def wait_connected(connected: asyncio.Queue, count: int):
+    """클라이언트 count개가 모두 연결될 때까지 대기"""
+    for _ in range(count):
+        await connected.get()
+
+
+async def run_case(concurrency: int, duration: float, log_file):
+    """모든 세션 연결 후 duration초 동안 호출하여 (총 호출 수, 실제 측정 시간) 반환"""
+    target = server_target("fashion")
+    connected, start, stop = asyncio.Queue(), asyncio.Event(), asyncio.Event()
+    tasks = [
+        asyncio.create_task(client_loop(target, connected, start, stop, log_file))
+        for _ in range(concurrency)
+    ]
+
+    # 연결 단계에서 실패한 클라이언트가 있으면 대기하지 않고 중단
+    waiter = asyncio.create_task(wait_connected(connected, concurrency))
+    done, _ = await asyncio.wait([waiter, *tasks], timeout=CONNECT_TIMEOUT, return_when=asyncio.FIRST_COMPLETED)
+    if waiter not in done:
+        waiter.cancel()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        failed = [task for task in done if not task.cancelled() and task.exception()]
+        raise failed[0].exception() if failed else TimeoutError(f"{CONNECT_TIMEOUT}초 안에 연결되지 않았습니다")
+
+    started = time.perf_counter()
+    start.set()
+    await asyncio.sleep(duration)
+    stop.set()
+    results = await asyncio.gather(*tasks)
+
+    calls = sum(count for count, _ in results)
+    elapsed = max(finished_at for _, finished_at in results) - started
+    return calls, max(elapsed, 1e-9)
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+
+    print(f"동시 클라이언트: {concurrency}, 측정 시간: {duration}s")
+    print("-" * 50)
+    for name, case_env in CASES:
+        for key in ("MCP_TRANSPORT", "MCP_WORKERS"):
+            os.environ.pop(key, None)
+        os.environ.update(case_env)
+        os.environ["FASHION_MCP_PORT"] = BENCH_PORT
+
+        server = None
+        if case_env["MCP_TRANSPORT"] != "stdio":
+            server = subprocess.Popen(
+                [sys.executable, "server.py"],
+                cwd=BASE_DIR,
+                env=os.environ.copy(),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        try:
+            if server is not None:
+                wait_for_port(int(BENCH_PORT))
+            # stdio 서버의 배너/로그가 결과 표에 섞이지 않도록 버림
+            with open(os.devnull, "w") as log_file:
+                calls, elapsed = asyncio.run(run_case(concurrency, duration, log_file))
+            print(f"{name:<18} {calls:>8} calls  {calls / elapsed:>10.1f} calls/s")
+        except Exception as e:
+            print(f"{name:<18} 실패: {e}")
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
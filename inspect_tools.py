@@ -1,9 +1,9 @@
 
 import asyncio
-from fastmcp import Client
+from mcp_runtime import server_target, create_client
 
 async def main():
-    async with Client("http://localhost:8002/sse") as client:
+    async with create_client(server_target("fashion")) as client:
         tools = await client.list_tools()
         for tool in tools:
             print(f"Name: {tool.name}")
@@ -0,0 +1,127 @@
+# log_config.py
+# 공통 로깅 설정 (환경 변수로 변경 가능)
+#
+#   LOG_LEVEL       : 로그 레벨 (기본 INFO)
+#   LOG_FORMAT      : text | json  (text는 기존 사람용 포맷, json은 한 줄 JSON)
+#   LOG_SAMPLE_RATE : 호출 단위 로그를 남길 호출의 비율 0.0~1.0 (기본 1.0)
+#   LOG_MAX_PAYLOAD : 로그에 포함되는 결과/입력 값의 최대 길이 (기본 200, 0이면 자르지 않음)
+#
+# 로그 레코드는 QueueHandler로 큐에 넣고, 별도 스레드의 QueueListener가 stderr에 기록합니다.
+# 따라서 도구 실행 경로에서는 포맷팅과 I/O가 일어나지 않습니다.
+#
+# 호출 단위 로그는 호출 시작 시 sample_call()로 한 번만 샘플링하고, 해당 호출의 모든 로그를
+# 그 결과로 감쌉니다. 제외된 호출은 LogRecord와 Payload를 만들지 않습니다.
+# 경고/오류/기동 로그는 감싸지 않으므로 항상 기록됩니다.
+#   log_call = sample_call()
+#   if log_call:
+#       logger.info("🔧 호출됨 | 입력: %s", Payload(name))
+#   ...
+#   if log_call:
+#       logger.info("   ✅ 결과: %s", Payload(result))
+#
+# Payload 규칙: 사용자 입력, 도구 결과, 예외 메시지처럼 길이가 정해지지 않은 값은 Payload로
+# 감싸고, 고정 문자열과 숫자는 그대로 넘깁니다.
+import os
+import json
+import queue
+import atexit
+import random
+import logging
+import logging.handlers
+from dotenv import load_dotenv
+
+TEXT_FORMAT = '%(asctime)s | %(levelname)s | %(message)s'
+TEXT_DATEFMT = '%H:%M:%S'
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_sample_rate = 1.0
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환"""
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = str(value) if isinstance(value, Payload) else value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    기본 QueueHandler는 큐에 넣기 전에 메시지를 포맷하므로, 포맷팅을 리스너 스레드로 미룸
+    주의: 인자(record.args)는 기록 시점에 포맷되므로 로그 호출 후 인자 객체를 변경하면 안 됩니다.
+    dict/list 등은 Payload로 감싸면 호출 시점의 얕은 복사본이 기록됩니다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def sample_call() -> bool:
+    """호출 하나의 로그를 남길지 LOG_SAMPLE_RATE 비율로 한 번 결정"""
+    return _sample_rate >= 1.0 or random.random() < _sample_rate
+
+
+class Payload:
+    """
+    로그용 지연 문자열 래퍼
+    실제로 기록될 때만 str()과 길이 제한(LOG_MAX_PAYLOAD)이 적용됩니다.
+    dict/list/set은 호출 시점 값이 기록되도록 얕은 복사본을 보관합니다.
+    """
+    __slots__ = ("value",)
+
+    max_length = 200  # setup_logging()에서 LOG_MAX_PAYLOAD로 설정
+
+    def __init__(self, value):
+        if isinstance(value, (dict, list, set)):
+            value = value.copy()
+        self.value = value
+
+    def __str__(self):
+        text = str(self.value)
+        if self.max_length and len(text) > self.max_length:
+            return f"{text[:self.max_length]}...(+{len(text) - self.max_length})"
+        return text
+
+    __repr__ = __str__
+
+
+def setup_logging():
+    """루트 로거에 큐 기반 비동기 핸들러를 설정 (여러 번 호출해도 한 번만 적용)"""
+    global _listener, _sample_rate
+    if _listener is not None:
+        return
+
+    # LOG_* 설정도 다른 설정처럼 .env에서 읽을 수 있도록 먼저 로드
+    load_dotenv()
+    _sample_rate = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+    Payload.max_length = int(os.getenv("LOG_MAX_PAYLOAD", "200"))
+
+    stream_handler = logging.StreamHandler()
+    if os.getenv("LOG_FORMAT", "text").strip().lower() == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATEFMT))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
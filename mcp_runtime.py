@@ -0,0 +1,115 @@
+# mcp_runtime.py
+# MCP 서버 실행 / 클라이언트 연결 설정 (환경 변수로 변경 가능)
+#
+#   MCP_TRANSPORT   : sse | http | stdio  (기본 sse, "streamable-http"는 http와 동일)
+#   MCP_HOST        : 서버 바인드 주소 (기본 127.0.0.1)
+#   MCP_CLIENT_HOST : 클라이언트가 접속할 서버 주소 (기본 localhost)
+#   MCP_WORKERS     : 워커 프로세스 수 (기본 1, 2 이상은 http 전송에서만 지원)
+#   FASHION_MCP_PORT / WEATHER_MCP_PORT : 서버별 포트 (기본 8002 / 8003)
+#
+# 서버와 클라이언트가 항상 같은 설정을 보도록 이 모듈을 임포트할 때 .env를 로드합니다.
+import os
+import sys
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+TRANSPORT_ALIASES = {
+    "sse": "sse",
+    "http": "http",
+    "streamable-http": "http",
+    "stdio": "stdio",
+}
+
+# 전송 방식별 기본 엔드포인트 경로 (FastMCP 기본값)
+TRANSPORT_PATHS = {
+    "sse": "/sse",
+    "http": "/mcp",
+}
+
+# 서버 이름 -> (스크립트 파일, 포트 환경 변수, 기본 포트)
+SERVER_SPECS = {
+    "fashion": ("server.py", "FASHION_MCP_PORT", 8002),
+    "weather": ("KoreaWeather.py", "WEATHER_MCP_PORT", 8003),
+}
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_transport() -> str:
+    """MCP_TRANSPORT 환경 변수를 정규화하여 반환"""
+    value = os.getenv("MCP_TRANSPORT", "sse").strip().lower()
+    transport = TRANSPORT_ALIASES.get(value)
+    if transport is None:
+        raise ValueError(f"지원하지 않는 MCP_TRANSPORT 값입니다: {value} (sse, http, stdio 중 선택)")
+    return transport
+
+
+def get_port(server_name: str) -> int:
+    """서버별 포트 반환"""
+    _, port_env, default_port = SERVER_SPECS[server_name]
+    return int(os.getenv(port_env, str(default_port)))
+
+
+def server_target(server_name: str) -> str:
+    """클라이언트가 접속할 대상 반환 (HTTP 계열은 URL, stdio는 스크립트 경로)"""
+    transport = get_transport()
+    script, _, _ = SERVER_SPECS[server_name]
+    if transport == "stdio":
+        return os.path.join(BASE_DIR, script)
+    host = os.getenv("MCP_CLIENT_HOST", "localhost")
+    return f"http://{host}:{get_port(server_name)}{TRANSPORT_PATHS[transport]}"
+
+
+def create_client(target: str, log_file=None):
+    """
+    대상(URL 또는 스크립트 경로)에 맞는 fastmcp Client 생성
+    log_file: stdio 서버 프로세스의 stderr 출력 대상 (기본은 부모 stderr)
+    """
+    from fastmcp import Client
+
+    if target.endswith(".py"):
+        # stdio 서버는 부모 환경을 상속하지 않으므로 전송 방식을 명시적으로 전달
+        from fastmcp.client.transports import PythonStdioTransport
+
+        env = {k: v for k, v in os.environ.items() if k.startswith(("MCP_", "WEATHER_", "FASHION_", "LOG_"))}
+        env["MCP_TRANSPORT"] = "stdio"
+        return Client(PythonStdioTransport(script_path=target, env=env, cwd=BASE_DIR, log_file=log_file))
+    return Client(target)
+
+
+def run_server(mcp, server_name: str, app_factory: str):
+    """
+    설정된 전송 방식으로 MCP 서버 실행
+    app_factory: 멀티 워커 실행 시 uvicorn이 임포트할 앱 팩토리 (예: "server:create_app")
+    """
+    transport = get_transport()
+    if transport == "stdio":
+        mcp.run(transport="stdio")
+        return
+
+    host = os.getenv("MCP_HOST", "127.0.0.1")
+    port = get_port(server_name)
+    workers = int(os.getenv("MCP_WORKERS", "1"))
+
+    if workers <= 1:
+        logger.info("🔌 전송: %s | http://%s:%d%s", transport, host, port, TRANSPORT_PATHS[transport])
+        mcp.run(transport=transport, host=host, port=port)
+        return
+
+    # SSE 세션은 프로세스 메모리에 묶여 있어 여러 워커에 분산할 수 없음
+    if transport != "http":
+        logger.error("❌ MCP_WORKERS > 1 은 MCP_TRANSPORT=http 에서만 지원됩니다.")
+        sys.exit(1)
+
+    import uvicorn
+
+    logger.info("🔌 전송: http (stateless) x %d workers | http://%s:%d%s", workers, host, port, TRANSPORT_PATHS["http"])
+    uvicorn.run(app_factory, factory=True, host=host, port=port, workers=workers, app_dir=BASE_DIR)
+
+
+def create_http_app(mcp):
+    """멀티 워커용 ASGI 앱 생성 (워커 간 세션 공유가 없도록 stateless 모드)"""
+    return mcp.http_app(transport="http", stateless_http=True)
@@ -1,13 +1,11 @@
 # server.py
 import logging
 from fastmcp import FastMCP
+from mcp_runtime import run_server, create_http_app
+from log_config import setup_logging, sample_call, Payload
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    datefmt='%H:%M:%S'
-)
+# 로깅 설정 (LOG_FORMAT, LOG_SAMPLE_RATE 등은 log_config.py 참고)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 # 1. MCP 서버 생성 (이름: Fashion Server)
@@ -34,14 +32,17 @@ def get_member_profile(name: str) -> str:
     팀원의 이름(name)을 입력하면 성별, 선호 스타일, 거주지 정보를 반환합니다.
     등록된 팀원: ideabong, sunny
     """
-    logger.info(f"🔧 [get_member_profile] 호출됨 | 입력: name='{name}'")
+    log_call = sample_call()
+    if log_call:
+        logger.info("🔧 [get_member_profile] 호출됨 | 입력: name='%s'", Payload(name))
     member = members_db.get(name)
     if not member:
         result = "존재하지 않는 팀원입니다."
-        logger.warning(f"   ⚠️ 결과: {result}")
+        logger.warning("   ⚠️ 결과: %s", result)
         return result
     result = str(member)
-    logger.info(f"   ✅ 결과: {result}")
+    if log_call:
+        logger.info("   ✅ 결과: %s", Payload(result))
     return result
 
 @mcp.tool()
@@ -50,9 +51,12 @@ def get_ootd_history(day: str) -> str:
     특정 요일(day)에 입었던 옷차림(OOTD) 기록을 반환합니다.
     입력 예시: monday, tuesday, wednesday
     """
-    logger.info(f"🔧 [get_ootd_history] 호출됨 | 입력: day='{day}'")
+    log_call = sample_call()
+    if log_call:
+        logger.info("🔧 [get_ootd_history] 호출됨 | 입력: day='%s'", Payload(day))
     result = ootd_log.get(day, "기록 없음")
-    logger.info(f"   ✅ 결과: {result}")
+    if log_call:
+        logger.info("   ✅ 결과: %s", Payload(result))
     return result
 
 @mcp.tool()
@@ -61,21 +65,28 @@ def get_current_weather(location: str) -> str:
     도시 이름(location)을 입력하면 현재 날씨를 반환합니다.
     지원 도시: Seoul, Busan
     """
-    logger.info(f"🔧 [get_current_weather] 호출됨 | 입력: location='{location}'")
+    log_call = sample_call()
+    if log_call:
+        logger.info("🔧 [get_current_weather] 호출됨 | 입력: location='%s'", Payload(location))
     # 실습을 위해 날씨 API 대신 고정값을 반환합니다.
     weather_data = {
         "Seoul": "15도, 맑음, 바람 약간",
         "Busan": "20도, 화창함"
     }
     result = weather_data.get(location, "알 수 없는 지역")
-    logger.info(f"   ✅ 결과: {result}")
+    if log_call:
+        logger.info("   ✅ 결과: %s", Payload(result))
     return result
 
 # 4. 서버 실행
+def create_app():
+    """멀티 워커 실행용 ASGI 앱 팩토리 (uvicorn이 워커마다 호출)"""
+    return create_http_app(mcp)
+
 if __name__ == "__main__":
     logger.info("=" * 50)
     logger.info("🚀 Fashion Server 시작 중...")
-    logger.info(f"📦 등록된 도구: get_member_profile, get_ootd_history, get_current_weather")
-    logger.info(f"👥 등록된 멤버: {list(members_db.keys())}")
+    logger.info("📦 등록된 도구: get_member_profile, get_ootd_history, get_current_weather")
+    logger.info("👥 등록된 멤버: %s", list(members_db.keys()))
     logger.info("=" * 50)
-    mcp.run(transport="sse", port=8002)
\ No newline at end of file
+    run_server(mcp, "fashion", "server:create_app")